@@ -113,6 +113,12 @@ class ImageCanvas(QWidget):
         self._overlay_rect_color = overlay_rect_color
         self._overlay_rect_fill_opacity = overlay_rect_fill_opacity
         self._overlay_brush_color = overlay_brush_color
+        # Pen and brushes to draw the overlay don't change, so create them once
+        self._overlay_brush = QBrush(overlay_brush_color)
+        self._overlay_rect_pen = QPen(overlay_rect_color, 3, Qt.SolidLine)
+        fill_color = QColor(overlay_rect_color)
+        fill_color.setAlpha(overlay_rect_fill_opacity)
+        self._overlay_rect_fill_brush = QBrush(fill_color)
         self._rectangle = None
         self._is_dragging = False
         self._prev_drag_pos = None  # Parent widget position, i.e. usually the position within the ImageViewer (scroll area )
@@ -241,7 +247,7 @@ class ImageCanvas(QWidget):
             r = l + w_roi
             b = t + h_roi
 
-            brush = QBrush(self._overlay_brush_color)
+            brush = self._overlay_brush
             # View/drawable area
             vx, vy = 0, 0
             vw = self._pixmap.width()
@@ -265,10 +271,8 @@ class ImageCanvas(QWidget):
                 qp.fillRect(QRect(vx, b, vw, h), brush)
             # Draw rectangle
             if self._overlay_rect_fill_opacity > 0:
-                color = self._overlay_rect_color
-                color.setAlpha(self._overlay_rect_fill_opacity)
-                qp.fillRect(QRect(l, t, w_roi, h_roi), QBrush(color))
-            qp.setPen(QPen(self._overlay_rect_color, 3, Qt.SolidLine))
+                qp.fillRect(QRect(l, t, w_roi, h_roi), self._overlay_rect_fill_brush)
+            qp.setPen(self._overlay_rect_pen)
             qp.drawLine(QPoint(l, t), QPoint(r, t))
             qp.drawLine(QPoint(r, t), QPoint(r, b))
             qp.drawLine(QPoint(r, b), QPoint(l, b))
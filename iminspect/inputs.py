@@ -901,6 +901,11 @@ class SelectDirEntryWidget(InputWidget):
 
 
 class RoiSelectWidget(InputWidget):
+    # Validator and font are shared by the line edits of all instances (lazily
+    # initialized, because they require a QApplication).
+    _NUM_VALIDATOR = None
+    _FIXED_FONT = None
+
     def __init__(self, label, roi=None, parent=None, min_label_width=None,
             box_labels=['L:', 'T:', 'W:', 'H:'], support_image_selection=True):
         """
@@ -908,6 +913,10 @@ class RoiSelectWidget(InputWidget):
         * Enable/disable the "Select from image" button via 'support_image_selection'
         """
         super(RoiSelectWidget, self).__init__(parent)
+        if RoiSelectWidget._NUM_VALIDATOR is None:
+            RoiSelectWidget._NUM_VALIDATOR = QRegExpValidator(QRegExp("[0-9]*"))
+        if RoiSelectWidget._FIXED_FONT is None:
+            RoiSelectWidget._FIXED_FONT = QFontDatabase.systemFont(QFontDatabase.FixedFont)
         layout = QHBoxLayout()
         lbl = QLabel(label)
         if min_label_width is not None:
@@ -923,8 +932,8 @@ class RoiSelectWidget(InputWidget):
             layout.addWidget(QLabel(lbls[idx]))
 
             le = QLineEdit()
-            le.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
-            le.setValidator(QRegExpValidator(QRegExp("[0-9]*"), le))
+            le.setFont(RoiSelectWidget._FIXED_FONT)
+            le.setValidator(RoiSelectWidget._NUM_VALIDATOR)
             le.setAlignment(Qt.AlignRight)
             le.setMinimumWidth(50)
             le.editingFinished.connect(self._emit_value_change)
@@ -941,14 +950,8 @@ class RoiSelectWidget(InputWidget):
         self.setLayout(layout)
 
     def get_input(self):
-        rect = list()
-        for i in range(4):
-            txt = self._line_edits[i].text()
-            if txt:
-                rect.append(int(txt))
-            else:
-                rect.append(None)
-        if any([v is None for v in rect]):
+        rect = [int(txt) if txt else None for txt in (le.text() for le in self._line_edits)]
+        if None in rect:
             return (None, None, None, None)
         return rect
 
@@ -962,7 +965,8 @@ class RoiSelectWidget(InputWidget):
 
     def __from_image(self):
         filename, _ = QFileDialog.getOpenFileName(self, "Select Image", "",
-                    "Images (*.jpg *.jpeg *png);;All Files (*.*);;")
+                    "Images (*.jpg *.jpeg *.png);;All Files (*.*);;", "",
+                    QFileDialog.DontUseNativeDialog)
         if filename:
             # Show modal dialog
             img_np = imutils.imread(filename)
@@ -981,6 +985,8 @@ class InputDemoApplication(QMainWindow):
 
     def __prepare_layout(self):
         self._main_widget = QWidget()
+        # Suppress intermediate repaints while populating the layout
+        self._main_widget.setUpdatesEnabled(False)
         main_layout = QVBoxLayout()
 
         self._folder_widget = SelectDirEntryWidget('Select folder:',
@@ -1064,6 +1070,8 @@ class InputDemoApplication(QMainWindow):
         self._roi.value_changed.connect(self._val_changed)
 
         self._main_widget.setLayout(main_layout)
+        self._main_widget.setUpdatesEnabled(True)
+        self._main_widget.update()
         self.setCentralWidget(self._main_widget)
         self.resize(QSize(640, 480))
 
@@ -1086,10 +1094,11 @@ def run_demo():
     print('Demonstration of custom (labelled) input widgets.\n')
     print('########################################################')
 
-    app = QApplication(['Input demo'])
+    # Reuse a running application instance (e.g. IPython's "%gui qt")
+    app = QApplication.instance() or QApplication(sys.argv)
     main_widget = InputDemoApplication()
     main_widget.show()
-    sys.exit(app.exec_())
+    sys.exit(app.exec())
 
 
 if __name__ == '__main__':
@@ -1,118 +1,196 @@
 #!/usr/bin/env python
 # coding=utf-8
-import os
+import bisect
+import functools
 import math
-import qimage2ndarray
+import os
+import numpy as np
 from qtpy.QtCore import Qt
 from qtpy.QtGui import QPainter, QFont, QColor, QPixmap, QImage, QPen, QIcon
 from typing import Tuple
 from pathlib import Path
 
 
+# Path to the iminspect logo
+_LOGO_PATH = str(Path(__file__).absolute().parent / 'iminspect_assets' / 'iminspect.svg')
+
+
 # Utils to format a data point (depending on the range)
 def fmtf(v):
-    return '{:f}'.format(v)
+    return f'{v:f}'
 
 
 def fmt4f(v):
-    return '{:.4f}'.format(v)
+    return f'{v:.4f}'
 
 
 def fmt3f(v):
-    return '{:.3f}'.format(v)
+    return f'{v:.3f}'
 
 
 def fmt2f(v):
-    return '{:.2f}'.format(v)
+    return f'{v:.2f}'
 
 
 def fmt1f(v):
-    return '{:.1f}'.format(v)
+    return f'{v:.1f}'
 
 
 def fmti(v):
-    if not math.isfinite(v):
-        return '?'  #TODO
-    return '{:d}'.format(int(v))
+    # Most values are finite, so we only pay for the exception on NaN/Inf
+    try:
+        return f'{int(v):d}'
+    except (ValueError, OverflowError):
+        return '?'
 
 
 def fmtb(v):
     return 'True' if v else 'False'
 
 
+# Upper bounds of the data span for each formatting function (i.e. span <= 0.5
+# uses fmtf, ..., span < 10 uses fmt2f, etc.), see bestFormatFx().
+_FORMAT_SPAN_BOUNDS = (0.5, 1.0, 2.0, float(np.nextafter(10.0, 0.0)), float(np.nextafter(100.0, 0.0)))
+_FORMAT_FXS = (fmtf, fmt4f, fmt3f, fmt2f, fmt1f, fmti)
+
+
 def bestFormatFx(limits):
     # Check range of data to select proper label formating
-    span = limits[1] - limits[0]
-    if span <= 0.5:
-        return fmtf
-    elif span <= 1.0:
-        return fmt4f
-    elif span <= 2.0:
-        return fmt3f
-    elif span < 10.0:
-        return fmt2f
-    elif span < 100.0:
-        return fmt1f
-    else:
+    # Compare as Python float (NumPy would compare float32 spans at float32 precision)
+    span = float(limits[1] - limits[0])
+    if math.isnan(span):
         return fmti
+    return _FORMAT_FXS[bisect.bisect_left(_FORMAT_SPAN_BOUNDS, span)]
+
+
+def uniqueWithInverse(data):
+    """
+    Returns the sorted unique values of data and the indices to reconstruct
+    it, as np.unique(data, return_inverse=True) - but the inverse keeps the
+    shape of data. For 8/16 bit unsigned data, this uses a histogram instead
+    of sorting all values.
+    """
+    if data.dtype.kind == 'u' and data.dtype.itemsize <= 2:
+        present = np.flatnonzero(np.bincount(data.ravel()))
+        lookup = np.zeros(present[-1] + 1 if present.size > 0 else 0, dtype=np.intp)
+        lookup[present] = np.arange(present.size)
+        return present.astype(data.dtype), lookup[data]
+    uniques, inverse = np.unique(data, return_inverse=True)
+    return uniques, inverse.reshape(data.shape)
 
 
 def isArrayLike(v):
     """Checks if v is a tuple or list."""
-    return isinstance(v, tuple) or isinstance(v, list)
+    return isinstance(v, (tuple, list))
 
 
 def pixmapFromNumPy(img_np):
+    # Imported on demand, so the formatting/filename utils can be used
+    # without loading the Qt/NumPy bridge.
+    import qimage2ndarray
     if img_np.ndim < 3 or img_np.shape[2] in [1, 3, 4]:
-        qimage = qimage2ndarray.array2qimage(img_np.copy())
+        # array2qimage copies the data into a newly allocated QImage anyhow,
+        # so we only need to ensure a contiguous memory layout.
+        qimage = qimage2ndarray.array2qimage(np.ascontiguousarray(img_np))
     else:
         img_width = max(400, min(img_np.shape[1], 1200))
         img_height = max(200, min(img_np.shape[0], 1200))
-        qimage = QImage(img_width, img_height, QImage.Format_RGB888)
-        qimage.fill(Qt.white)
-        qp = QPainter()
-        qp.begin(qimage)
-        qp.setRenderHint(QPainter.HighQualityAntialiasing)
-        qp.setPen(QPen(QColor(200, 0, 0)))
-        font = QFont()
-        font.setPointSize(20)
-        font.setBold(True)
-        font.setFamily('Helvetica')
-        qp.setFont(font)
-        qp.drawText(qimage.rect(), Qt.AlignCenter, "Error!\nCannot display a\n{:d}-channel image.".format(img_np.shape[2]))
-        qp.end()
+        qimage = _buildChannelErrorImage(img_width, img_height, img_np.shape[2])
     if qimage.isNull():
         raise ValueError('Invalid image received, cannot convert it to QImage')
     return QPixmap.fromImage(qimage)
 
 
-def emptyInspectionImage(img_size: Tuple[int, int] = (640, 320)):
-    """Returns a dummy image to be displayed if the inspector is
-    called with invalid (None) data."""
-    img_width, img_height = img_size
+@functools.lru_cache(maxsize=1)
+def _logoIcon():
+    """Returns the (lazily loaded) iminspect logo."""
+    return QIcon(_LOGO_PATH)
+
+
+@functools.lru_cache(maxsize=16)
+def _logoPixmap(sz):
+    """Returns the iminspect logo rasterized to sz x sz pixels."""
+    return _logoIcon().pixmap(sz, sz)
+
+
+@functools.lru_cache(maxsize=1)
+def _messagePen():
+    """Returns the (shared) pen to draw error/info messages."""
+    return QPen(QColor(200, 0, 0))
+
+
+@functools.lru_cache(maxsize=4)
+def _messageFont(point_size):
+    """Returns the (shared) font to draw error/info messages."""
+    font = QFont('Helvetica')
+    font.setPointSize(point_size)
+    font.setBold(True)
+    return font
+
+
+@functools.lru_cache(maxsize=8)
+def _buildChannelErrorImage(img_width, img_height, num_channels):
+    """Renders the error message shown instead of images with an
+    unsupported number of channels."""
+    qimage = QImage(img_width, img_height, QImage.Format_RGB888)
+    qimage.fill(Qt.white)
+    qp = QPainter()
+    qp.begin(qimage)
+    qp.setRenderHint(QPainter.TextAntialiasing)
+    qp.setPen(_messagePen())
+    qp.setFont(_messageFont(20))
+    qp.drawText(qimage.rect(), Qt.AlignCenter, "Error!\nCannot display a\n{:d}-channel image.".format(num_channels))
+    qp.end()
+    return qimage
+
+
+@functools.lru_cache(maxsize=8)
+def _buildEmptyInspectionImage(img_width, img_height):
+    """Renders the dummy image, see emptyInspectionImage()."""
+    import qimage2ndarray
     qimage = QImage(img_width, img_height, QImage.Format_RGB32)
     qimage.fill(Qt.white)
     qp = QPainter()
     qp.begin(qimage)
-    qp.setRenderHint(QPainter.HighQualityAntialiasing)
+    qp.setRenderHint(QPainter.TextAntialiasing)
     sz = min(100, min(img_width, img_height))
-    logo = QIcon(str(Path(__file__).absolute().parent / 'iminspect_assets' / 'iminspect.svg')).pixmap(sz, sz)
+    logo = _logoPixmap(sz)
     qp.drawPixmap((img_width - sz) // 2, 20, logo)
-    qp.setPen(QPen(QColor(200, 0, 0)))
-    font = QFont()
-    font.setPointSize(24)
-    font.setBold(True)
-    font.setFamily('Helvetica')
-    qp.setFont(font)
+    qp.setPen(_messagePen())
+    qp.setFont(_messageFont(24))
     qp.drawText(qimage.rect(), Qt.AlignCenter, "No data selected for inspection!")
     qp.end()
-    return qimage2ndarray.rgb_view(qimage)
+    # rgb_view only supports 32-bit formats and returns a strided view into
+    # the QImage. Compact it once, so the cache holds a contiguous 3-channel
+    # buffer (and subsequent copies are plain memcpys).
+    return np.ascontiguousarray(qimage2ndarray.rgb_view(qimage))
+
+
+def emptyInspectionImage(img_size: Tuple[int, int] = (640, 320)):
+    """Returns a dummy image to be displayed if the inspector is
+    called with invalid (None) data."""
+    # Rendering is cached per size, so hand out a copy the caller may modify.
+    return _buildEmptyInspectionImage(*img_size).copy()
     # import numpy as np
     # npi = qimage2ndarray.rgb_view(qimage).astype(np.float32)
     # npi[0,0,0] = np.Inf
     # npi[10, 100, 2] = np.NaN
     # return npi
 
+
+# File extensions used by the FilenameUtils.ensure...Extension() wrappers
+_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.ppm', '.bmp')
+_FLOW_EXTENSIONS = ('.flo',)
+_NUMPY_EXTENSIONS = ('.npy',)
+
+
+@functools.lru_cache(maxsize=16)
+def _normalizedExtensions(extensions):
+    """Returns the given tuple of file extensions lower-cased and
+    prefixed by '.' (if needed)."""
+    return tuple(e if e.startswith('.') else '.' + e for e in (x.lower() for x in extensions))
+
+
 class FilenameUtils(object):
     @staticmethod
     def ensureFileExtension(filename, extensions):
@@ -128,14 +206,8 @@ class FilenameUtils(object):
         if len(extensions) == 0:
             raise ValueError('List of extensions to test agains cannot be empty')
         _, ext = os.path.splitext(filename.lower())
-        for e in extensions:
-            # Ensure that the extension to test agains starts with '.'
-            if e.startswith('.'):
-                test_ext = e
-            else:
-                test_ext = '.' + e
-            if test_ext.lower() == ext:
-                return filename
+        if ext in _normalizedExtensions(tuple(extensions)):
+            return filename
         # No extension matched, thus append the first one
         if extensions[0].startswith('.'):
             return filename + extensions[0]
@@ -148,16 +220,16 @@ class FilenameUtils(object):
         Otherwise, appends PNG extension.
         """
         return FilenameUtils.ensureFileExtension(
-            filename, ['.png', '.jpg', '.jpeg', '.ppm', '.bmp'])
+            filename, _IMAGE_EXTENSIONS)
 
     @staticmethod
     def ensureFlowExtension(filename):
         """Ensures that the given filename has the .flo extension."""
         return FilenameUtils.ensureFileExtension(
-            filename, ['.flo'])
+            filename, _FLOW_EXTENSIONS)
 
     @staticmethod
     def ensureNumpyExtension(filename):
         """Ensures that the given filename has the .npy extension."""
         return FilenameUtils.ensureFileExtension(
-            filename, ['.npy'])
+            filename, _NUMPY_EXTENSIONS)
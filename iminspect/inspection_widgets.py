@@ -2,16 +2,146 @@
 # coding=utf-8
 """Inspect matrix/image data"""
 
+import functools
 import math
+from collections import namedtuple
 import numpy as np
 from qtpy.QtWidgets import QWidget, QDialog, QHBoxLayout, QVBoxLayout, QPushButton, QLabel, QToolButton
-from qtpy.QtCore import Qt, QSize, QRect, QPoint, QPointF, Signal, Slot
-from qtpy.QtGui import QPainter, QFont, QFontMetrics, QBrush, QColor, QIcon, QPen
+from qtpy.QtCore import Qt, QSize, QRect, QRectF, QPoint, QLineF, Signal, Slot
+from qtpy.QtGui import QPainter, QFont, QFontMetrics, QIcon, QPen, QImage, QPixmap, qRgb
 from vito import flowutils
 
 from . import imgview, inputs, inspection_utils, inspector
 
 
+@functools.lru_cache(maxsize=4)
+def _flowWheelPixmap(diameter):
+    """Renders the optical flow color wheel of the given diameter."""
+    # Create optical flow that will be visualized as color wheel
+    coords = np.linspace(-1, 1, diameter)
+    rgba = np.empty((diameter, diameter, 4), dtype=np.uint8)
+    # Alpha mask to draw a circle (comparing the squared radius suffices, and
+    # the grid is separable, so we only need to square the 1D coordinates)
+    sq = coords * coords
+    alpha = rgba[:, :, 3]
+    np.less_equal(np.add.outer(sq, sq), 1.0, out=alpha, casting='unsafe')
+    alpha *= 255
+    # colorize_flow() would normalize by the maximum radius (i.e. the corners
+    # at sqrt(2)), which we know beforehand. So we can skip stacking the flow,
+    # normalize the 1D coordinates and colorize the components directly.
+    ncoords = coords / math.sqrt(2.0)
+    u, v = np.meshgrid(ncoords, ncoords)
+    rgba[:, :, :3] = flowutils.colorize_uv(u, v)
+    # Wrap the buffer directly, QPixmap.fromImage() copies it anyways
+    return QPixmap.fromImage(QImage(rgba.data, diameter, diameter, 4 * diameter,
+                                    QImage.Format_RGBA8888))
+
+
+# Static geometry of the flow wheel, see _flowWheelLayout()
+_FlowWheelLayout = namedtuple('_FlowWheelLayout',
+                              ['pixmap', 'pos', 'line_v', 'line_h', 'text_rect', 'text_visible', 'diameter'])
+
+
+@functools.lru_cache(maxsize=4)
+def _flowWheelLayout(width, height, padding, line_width):
+    """Returns the wheel pixmap, its cross and label geometry for the given widget size."""
+    # Widgets may be collapsed (e.g. within a splitter), but we still need a valid pixmap
+    diameter = max(1, int(min(width, height) - 2 * padding))
+    radius = diameter / 2
+    cx, cy = width / 2, height / 2
+    left, right = cx - radius, cx + radius
+    top, bottom = cy - radius, cy + radius
+    line_v = QLineF(cx, top + line_width, cx, bottom - line_width)
+    line_h = QLineF(left + line_width, cy, right - line_width, cy)
+    txt_height = int((height - 2*padding - diameter - 5) / 2)
+    text_rect = QRectF(int(left), padding, diameter, txt_height)
+    return _FlowWheelLayout(_flowWheelPixmap(diameter), QPoint(int(left), int(top)),
+                            line_v, line_h, text_rect, txt_height > 30, diameter)
+
+
+def _stripImage(rgb):
+    """Converts the Hx3 uint8 colors to a 1 pixel wide QImage."""
+    rgb = np.ascontiguousarray(rgb)
+    # QImage doesn't take ownership of the buffer, but converting to RGB32 (the
+    # raster engine's native format) creates a copy anyways. This also saves
+    # the format conversion whenever the strip is blitted.
+    return QImage(rgb.data, 1, rgb.shape[0], 3, QImage.Format_RGB888).convertToFormat(
+        QImage.Format_RGB32)
+
+
+def _gradientImage(colormap):
+    """
+    Returns the (Nx3 uint8) colormap as 1 pixel wide QImage (largest value on
+    top), which can be scaled to the bar's height.
+    """
+    return _stripImage(colormap[::-1])
+
+
+def _categoricalImage(colormap, num_categories):
+    """
+    Returns a 1 pixel wide QImage with one row of color per category (largest
+    category on top), which can be scaled to the bar's height.
+    """
+    # Same binning as imvis.pseudocolor() applies to the category indices (limits
+    # [0, num_categories-1]), so the colors match the displayed label image
+    if num_categories > 1:
+        interval = (num_categories - 1) / (colormap.shape[0] - 1)
+        cm_indices = np.floor(np.arange(num_categories) / interval).astype(np.int32)
+    else:
+        cm_indices = np.zeros(1, dtype=np.int32)
+    return _stripImage(colormap[cm_indices[::-1]])
+
+
+@functools.lru_cache(maxsize=8)
+def _categoricalLabelLayout(height, num_categories, font_size, label_x):
+    """
+    Returns the indices of the categories to be labeled (a subset, if there's
+    too little space) and the corresponding text positions.
+    """
+    # Block boundaries (exact integer arithmetic, the bar image is scaled accordingly)
+    edges = [(i * height) // num_categories for i in range(num_categories + 1)]
+    # Compute label positions (vertically centered, adjust if outside of canvas)
+    label_ys = [max(font_size, min(top + (bottom - top + font_size) // 2, height))
+                for top, bottom in zip(edges[:-1], edges[1:])]
+    # Now the label positions are computed from largest value to smallest, but
+    # categories are listed from smallest value to largest. Thus:
+    label_ys.reverse()
+    # Check, if all labels fit (font size vs widget height).
+    height_per_label = max(height / num_categories, 1.1*font_size)
+    num_labels = min(num_categories, math.ceil(height / height_per_label))
+    # If there's too little space, select a subset of labels (and their
+    # corresponding text positions), evenly spaced across all categories.
+    if num_labels > 1:
+        selected_idx = [(i * (num_categories - 1)) // (num_labels - 1) for i in range(num_labels)]
+    else:
+        selected_idx = [0]
+    positions = [QPoint(label_x, label_ys[i]) for i in selected_idx]
+    return selected_idx, positions
+
+
+@functools.lru_cache(maxsize=8)
+def _gradientLabelLayout(height, lower, upper, fmt, max_num_labels, font_size, label_x):
+    """
+    Returns the positions and texts of the gradient's labels (largest value
+    on top), as the labels only depend on the widget height and limits.
+    """
+    height_per_label = max(height / max_num_labels, 2*font_size)
+    num_labels = min(max_num_labels, int(height / height_per_label))
+    labels = np.linspace(lower, upper, num_labels)
+    label_ys = (height - np.arange(num_labels) * (height - font_size)
+                / (num_labels-1)).astype(np.int32).tolist()
+    return [QPoint(label_x, y) for y in label_ys], [fmt(v) for v in labels]
+
+
+def _booleanImage(colormap):
+    """Returns a 1x2 QImage showing the colors for True (top) and False (bottom)."""
+    img = QImage(1, 2, QImage.Format_Indexed8)
+    img.setColorTable([qRgb(*rgb) for rgb in colormap[[0, -1]].tolist()])
+    img.setPixel(0, 0, 1)
+    img.setPixel(0, 1, 0)
+    return img
+
+
 class ColorBar(QWidget):
     """Draws a vertical color bar."""
     def __init__(self):
@@ -20,37 +150,110 @@ class ColorBar(QWidget):
         self._bar_padding = 5
         self._min_height = 80
         self._font_size = 10
+        self._font = QFont('sans-serif', self._font_size)
+        self._font_metrics = QFontMetrics(self._font)
+        self._cross_pen = QPen(Qt.black, 1)
         self._num_labels = 10
 
         self.setMinimumHeight(self._min_height)
         self.setMinimumWidth(100)
         self._colormap = None
+        self._colormap_arr = None
+        self._bar_img = None
+        self._bar_img_key = None
+        self._boolean_img = None
         self._limits = None
+        self._label_fmt = None
         self._show_flow_wheel = False
         self._is_boolean = False
         self._categories = None
         self._categorical_labels = None
+        # Minimum width required by the currently displayed labels, will be
+        # (re-)computed upon the next paint after the content or size changed.
+        self._cached_min_width = None
+
+    def _invalidateMinWidth(self):
+        self._cached_min_width = None
+
+    def _barRect(self):
+        return QRect(self._bar_padding, 0, self._bar_width, self.height())
+
+    def _labelRect(self):
+        # Labels are drawn to the right of the bar
+        left = 2*self._bar_padding + self._bar_width
+        return QRect(left, 0, max(0, self.width() - left), self.height())
 
     def setBoolean(self, b):
         # If the visualized data is boolean, set this to True!
         self._is_boolean = b
+        self._invalidateMinWidth()
+        self.update()
 
     def setCategories(self, c):
         # If the visualized data is categorical (i.e. a label image), set the unique categories!
         self._categories = c
+        self._bar_img = None
+        self._invalidateMinWidth()
+        self.update()
 
     def setCategoricalLabels(self, lbl_dict):
         # If the data is categorical, you can provide a dict {category: 'some label'}
         self._categorical_labels = lbl_dict
+        self._invalidateMinWidth()
+        self.update(self._labelRect())
 
     def setLimits(self, limits):
+        # The inspector sets the limits upon each display update, but we only
+        # need to choose a new label format (and width) if they changed
+        if limits is not None and self._limits is not None \
+                and tuple(limits) == tuple(self._limits):
+            return
         self._limits = limits
+        self._label_fmt = None if limits is None else inspection_utils.bestFormatFx(limits)
+        self._invalidateMinWidth()
+        self.update()
 
     def setColormap(self, colormap):
+        # The inspector sets the colormap upon each display update (e.g. while
+        # dragging the range slider), so skip rebuilding the color lookups
+        if colormap is self._colormap:
+            return
         self._colormap = colormap
+        if colormap is None:
+            self._colormap_arr = None
+            self._boolean_img = None
+        else:
+            # Convert once, so the paint branches can use batched indexing
+            self._colormap_arr = np.ascontiguousarray(colormap, dtype=np.uint8)
+            self._boolean_img = _booleanImage(self._colormap_arr)
+        self._bar_img = None
+        self._invalidateMinWidth()
+        self.update()
 
     def setFlowWheel(self, show_wheel):
         self._show_flow_wheel = show_wheel
+        self._invalidateMinWidth()
+        self.update()
+
+    def resizeEvent(self, event):
+        super(ColorBar, self).resizeEvent(event)
+        # Number of labels (and flow wheel size) depend on the widget size
+        self._invalidateMinWidth()
+
+    def _barImage(self):
+        """
+        Returns the 1 pixel wide image of the gradient/category colors, which
+        is only recreated if the colormap or categories changed. Qt scales it
+        to the bar, so it doesn't depend on the widget size.
+        """
+        num_categories = None if self._categories is None else len(self._categories)
+        if self._bar_img is None or num_categories != self._bar_img_key:
+            if num_categories is None:
+                self._bar_img = _gradientImage(self._colormap_arr)
+            else:
+                self._bar_img = _categoricalImage(self._colormap_arr, num_categories)
+            self._bar_img_key = num_categories
+        return self._bar_img
 
     def paintEvent(self, event):
         if not self._show_flow_wheel and (self._colormap is None
@@ -59,132 +262,95 @@ class ColorBar(QWidget):
         size = self.size()
         qp = QPainter()
         qp.begin(self)
-        font = QFont('sans-serif', self._font_size)
-        font_metrics = QFontMetrics(font)
-        qp.setFont(font)
+        # Everything we draw is axis-aligned, and the color strips must be
+        # scaled without interpolation (to keep sharp category blocks)
+        qp.setRenderHint(QPainter.Antialiasing, False)
+        qp.setRenderHint(QPainter.SmoothPixmapTransform, False)
+        qp.setFont(self._font)
+        font_metrics = self._font_metrics
+        # Text extents are only needed if the minimum width must be recomputed
+        measure = self._cached_min_width is None
 
         if self._is_boolean:
             # For binary/boolean data, we only need to show the two visualized colors.
-            rgb = self._colormap[-1]
-            brush = QBrush(QColor(rgb[0], rgb[1], rgb[2]))
-            qp.fillRect(self._bar_padding, 0, self._bar_width, int(np.ceil(size.height()/2)), brush)
-            rgb = self._colormap[0]
-            brush = QBrush(QColor(rgb[0], rgb[1], rgb[2]))
-            qp.fillRect(self._bar_padding, int(np.floor(size.height()/2)),
-                        self._bar_width, int(np.ceil(size.height()/2)), brush)
+            # Qt scales the 1x2 image (True on top) to the bar's size.
+            qp.drawImage(self._barRect(), self._boolean_img)
             # Draw labels
             qp.drawText(QPoint(2*self._bar_padding + self._bar_width, int(size.height()*0.25)),
                         'True')
             qp.drawText(QPoint(2*self._bar_padding + self._bar_width, int(size.height()*0.75)),
                         'False')
-            max_label_width = font_metrics.width('False')
-            self.setMinimumWidth(3 * self._bar_padding + self._bar_width + max_label_width)
+            if measure:
+                min_width = 3 * self._bar_padding + self._bar_width + font_metrics.width('False')
         elif self._categories is not None:
             # For label images, we don't need the full colormap gradient, but only
             # one block for each class/label/category.
 
-            # Compute height of each colored block.
-            num_categories = len(self._categories)
-            step_height = size.height() / float(num_categories)
-            cm_indices = np.linspace(0, 255, num_categories).astype(np.uint8)
             # Draw the category colors from top to bottom (largest ID/category/label first).
-            top = 0.0
-            label_pos = list()
-            for i in range(num_categories):
-                rgb = self._colormap[cm_indices[num_categories-1-i]]
-                brush = QBrush(QColor(rgb[0], rgb[1], rgb[2]))
-                qp.fillRect(self._bar_padding, int(np.floor(top)),
-                            self._bar_width, int(np.ceil(step_height)), brush)
-                # Compute label position (vertically centered, adjust if outside of canvas)
-                ly = max(self._font_size, min(np.floor(top + step_height/2 + self._font_size/2), size.height()))
-                label_pos.append(QPoint(2*self._bar_padding + self._bar_width, ly))
-                # Move to next category.
-                top += step_height
-            # Now the label positions are computed from largest value to smallest, but
-            # categories are listed from smallest value to largest. Thus:
-            label_pos.reverse()
-            # Draw labels (vertically centered on corresponding filled rects)
-            # Check, if all labels fit (font size vs widget height).
-            height_per_label = max(size.height() / num_categories, 1.1*self._font_size)
-            num_labels = min(num_categories, int(math.ceil(size.height() / height_per_label)))
-            # If there's too little space, select a subset of labels (and their
-            # corresponding text positions).
-            selected_idx = np.linspace(0, num_categories-1, num_labels)
-            labels = [self._categories[int(i)] for i in selected_idx]
-            lpos = [label_pos[int(i)] for i in selected_idx]
-            longest_label = ''
-            for i in range(num_labels):
-                if self._categorical_labels is not None and labels[i] in self._categorical_labels:
-                    txt = self._categorical_labels[labels[i]]
-                else:
-                    txt = inspection_utils.fmti(labels[i])
-                if len(txt) > len(longest_label):
-                    longest_label = txt
-                qp.drawText(lpos[i], txt)
-            max_label_width = font_metrics.width(longest_label)
-            self.setMinimumWidth(3 * self._bar_padding + self._bar_width + max_label_width)
+            qp.drawImage(self._barRect(), self._barImage())
+            # Draw labels (vertically centered on corresponding filled rects).
+            # Their layout only depends on the widget height and number of categories.
+            selected_idx, lpos = _categoricalLabelLayout(
+                size.height(), len(self._categories), self._font_size,
+                2*self._bar_padding + self._bar_width)
+            labels = [self._categories[i] for i in selected_idx]
+            cat_labels = self._categorical_labels or {}
+            txts = [cat_labels[lbl] if lbl in cat_labels else inspection_utils.fmti(lbl)
+                    for lbl in labels]
+            for pos, txt in zip(lpos, txts):
+                qp.drawText(pos, txt)
+            if measure:
+                max_label_width = max(font_metrics.width(txt) for txt in txts)
+                min_width = 3 * self._bar_padding + self._bar_width + max_label_width
         elif self._show_flow_wheel:
-            # Draw the flow color wheel, centered on the widget
-            center = QPointF(size.width() / 2, size.height() / 2)
-            diameter = int(min(size.width(), size.height()) - 2 * self._bar_padding)
-            radius = diameter / 2
-            # Create optical flow that will be visualized as color wheel
-            coords = np.linspace(-1, 1, diameter)
-            xv, yv = np.meshgrid(coords, coords)
-            flow = np.dstack((xv, yv))
-            colorized = flowutils.colorize_flow(flow)
-            # Create an alpha mask to draw a circle
-            alpha_mask = np.zeros((diameter, diameter), dtype=np.uint8)
-            where = np.sqrt(np.square(xv) + np.square(yv)) <= 1.0
-            alpha_mask[where] = 255
-            colorized = np.dstack((colorized, alpha_mask))
-            # Draw the color wheel
-            qpixmap = inspection_utils.pixmapFromNumPy(colorized)
-            qp.drawPixmap(center.x() - radius, center.y() - radius, qpixmap)
+            # Draw the flow color wheel, centered on the widget. Its pixmap and
+            # geometry only depend on the widget size, so we reuse them across
+            # repaints (and ColorBar instances)
+            wheel = _flowWheelLayout(size.width(), size.height(), self._bar_padding,
+                                     self._cross_pen.width())
+            qp.drawPixmap(wheel.pos, wheel.pixmap)
             # Overlay a cross
-            cx, cy = center.x(), center.y()
-            left, right = cx - radius, cx + radius
-            top, bottom = cy - radius, cy + radius
-            line_width = 1
-            qp.setPen(QPen(Qt.black, line_width))
-            qp.drawLine(cx, top + line_width, cx, bottom - line_width)
-            qp.drawLine(left + line_width, cy, right - line_width, cy)
+            qp.setPen(self._cross_pen)
+            qp.drawLine(wheel.line_v)
+            qp.drawLine(wheel.line_h)
             # Label it
-            txt_height = int((size.height() - 2*self._bar_padding - diameter - 5) / 2)
-            if txt_height > 30:
-                qp.drawText(QRect(center.x() - radius, self._bar_padding, diameter, txt_height),
-                    Qt.AlignHCenter | Qt.AlignBottom, 'Flow\nColor Wheel')
-            self.setMinimumWidth(2 * self._bar_padding + max(diameter, font_metrics.width('Color Wheel')))
+            if wheel.text_visible:
+                qp.drawText(wheel.text_rect, Qt.AlignHCenter | Qt.AlignBottom, 'Flow\nColor Wheel')
+            if measure:
+                min_width = 2 * self._bar_padding + max(wheel.diameter, font_metrics.width('Color Wheel'))
         else:
-            # Draw color gradients
-            num_gradient_steps = min(size.height(), 256)
-            step_height = size.height() / float(num_gradient_steps)
-            cm_indices = np.linspace(0, 255, num_gradient_steps).astype(np.uint8)
-            top = 0.0
-            for i in range(num_gradient_steps):
-                rgb = self._colormap[cm_indices[num_gradient_steps-1-i]]
-                brush = QBrush(QColor(rgb[0], rgb[1], rgb[2]))
-                qp.fillRect(self._bar_padding, int(np.floor(top)),
-                            self._bar_width, int(np.ceil(step_height)), brush)
-                top += step_height
+            # Draw color gradient (Qt scales the colormap strip to the bar)
+            qp.drawImage(self._barRect(), self._barImage())
             # Draw labels
-            fmt = inspection_utils.bestFormatFx(self._limits)
-            height_per_label = max(size.height() / self._num_labels, 2*self._font_size)
-            num_labels = min(self._num_labels, int(size.height() / height_per_label))
-            labels = np.linspace(self._limits[0], self._limits[1], num_labels)
-            longest_label = ''
-            for i in range(num_labels):
-                pos = QPoint(2*self._bar_padding + self._bar_width,
-                             int(size.height() - i * (size.height()-self._font_size)/(num_labels-1)))
-                txt = fmt(labels[i])
+            lpos, txts = _gradientLabelLayout(
+                size.height(), float(self._limits[0]), float(self._limits[1]), self._label_fmt,
+                self._num_labels, self._font_size, 2*self._bar_padding + self._bar_width)
+            for pos, txt in zip(lpos, txts):
                 qp.drawText(pos, txt)
-                if len(txt) > len(longest_label):
-                    longest_label = txt
-            max_label_width = font_metrics.width(longest_label)
-            self.setMinimumWidth(3 * self._bar_padding + self._bar_width + max_label_width)
+            if measure:
+                max_label_width = max(font_metrics.width(txt) for txt in txts)
+                min_width = 3 * self._bar_padding + self._bar_width + max_label_width
         # We're done painting
         qp.end()
-        # Adjust widget's minimum width according to actual rendering
+        # Adjust widget's minimum width according to actual rendering. This
+        # invalidates the layout, so only do it if the content/size changed.
+        if measure:
+            self._cached_min_width = min_width
+            self.setMinimumWidth(min_width)
+
+
+_FILTER_IMAGES = 'Images (*.bmp *.jpg *.jpeg *.png *.ppm)'
+_FILTER_FLOW = 'Optical Flow (*.flo)'
+_FILTER_NUMPY = 'NumPy Arrays (*.npy)'
+_FILE_FILTERS = ';;'.join((_FILTER_IMAGES, _FILTER_FLOW, _FILTER_NUMPY, 'All Files (*.*)'))
+
+
+@functools.lru_cache(maxsize=1)
+def _initialFileFilters():
+    """Maps data types to their preselected file filter."""
+    # Built upon first use, because the inspector module imports this one
+    return {inspector.DataType.FLOW: _FILTER_FLOW,
+            inspector.DataType.MULTICHANNEL: _FILTER_NUMPY}
 
 
 class OpenInspectionFileDialog(QDialog):
@@ -207,18 +373,10 @@ class OpenInspectionFileDialog(QDialog):
     def __prepareLayout(self, current_data_type, filename_suggestion, current_thumbnail):
         self.setWindowTitle('Open File')
         layout = QVBoxLayout()
-        file_filters = 'Images (*.bmp *.jpg *.jpeg *.png *.ppm);;Optical Flow (*.flo);;NumPy Arrays (*.npy);;All Files (*.*)'
-        if current_data_type is None:
-            initial_filter = ''
-        elif current_data_type == inspector.DataType.FLOW:
-            initial_filter = 'Optical Flow (*.flo)'
-        elif current_data_type == inspector.DataType.MULTICHANNEL:
-            initial_filter = 'NumPy Arrays (*.npy)'
-        else:
-            initial_filter = ''
+        initial_filter = _initialFileFilters().get(current_data_type, '')
         self._file_widget = inputs.SelectDirEntryWidget('File:',
             inputs.SelectDirEntryType.FILENAME_OPEN, parent=self,
-            filters=file_filters,
+            filters=_FILE_FILTERS,
             initial_filter=initial_filter,
             min_label_width=None, relative_base_path=None)
         self._file_widget.value_changed.connect(self.__fileSelected)
@@ -337,16 +495,10 @@ class SaveInspectionFileDialog(QDialog):
     def __prepareLayout(self, data_type):
         self.setWindowTitle('Save File')
         layout = QVBoxLayout()
-        file_filters = 'Images (*.bmp *.jpg *.jpeg *.png *.ppm);;Optical Flow (*.flo);;NumPy Arrays (*.npy);;All Files (*.*)'
-        if data_type == inspector.DataType.FLOW:
-            initial_filter = 'Optical Flow (*.flo)'
-        elif data_type == inspector.DataType.MULTICHANNEL:
-            initial_filter = 'NumPy Arrays (*.npy)'
-        else:
-            initial_filter = 'Images (*.bmp *.jpg *.jpeg *.png *.ppm)'
+        initial_filter = _initialFileFilters().get(data_type, _FILTER_IMAGES)
         self._file_widget = inputs.SelectDirEntryWidget('File:',
             inputs.SelectDirEntryType.FILENAME_SAVE, parent=self,
-            filters=file_filters,
+            filters=_FILE_FILTERS,
             initial_filter=initial_filter,
             min_label_width=None, relative_base_path=None)
         self._file_widget.value_changed.connect(self.__fileSelected)
@@ -501,6 +653,14 @@ class ChangeDataTypeDialog(QDialog):
         return None
 
 
+@functools.lru_cache(maxsize=None)
+def _themeIcon(name):
+    """Looks up the theme icon only once (shared by all toolbar instances)."""
+    # To look up names of theme icons, see
+    # https://specifications.freedesktop.org/icon-naming-spec/icon-naming-spec-latest.html
+    return QIcon.fromTheme(name)
+
+
 class ToolbarFileIOWidget(QWidget):
     """
     Provides buttons to issue open/save file requests.
@@ -525,9 +685,7 @@ class ToolbarFileIOWidget(QWidget):
             layout = QHBoxLayout()
         # Add "Open File" button
         btn = QToolButton()
-        # To look up names of theme icons, see
-        # https://specifications.freedesktop.org/icon-naming-spec/icon-naming-spec-latest.html
-        btn.setIcon(QIcon.fromTheme('document-open'))
+        btn.setIcon(_themeIcon('document-open'))
         btn.setIconSize(icon_size)
         btn.setToolTip('Open file (Ctrl+O)')
         btn.clicked.connect(self.fileOpenRequest)
@@ -535,7 +693,7 @@ class ToolbarFileIOWidget(QWidget):
 
         # Add "Save as..." button
         btn = QToolButton()
-        btn.setIcon(QIcon.fromTheme('document-save-as'))
+        btn.setIcon(_themeIcon('document-save-as'))
         btn.setIconSize(icon_size)
         btn.setToolTip('Save as... (Ctrl+S)')
         btn.clicked.connect(self.fileSaveRequest)
@@ -543,7 +701,7 @@ class ToolbarFileIOWidget(QWidget):
         
         # Add "Change visualization" button
         btn = QToolButton()
-        btn.setIcon(QIcon.fromTheme('view-refresh'))
+        btn.setIcon(_themeIcon('view-refresh'))
         btn.setIconSize(icon_size)
         btn.setToolTip('Reload/Change visualization (Ctrl+R)')
         btn.clicked.connect(self.visualizationChangeRequest)
@@ -574,18 +732,19 @@ class ToolbarZoomWidget(QWidget):
     def __init__(self, central_widget, parent=None):
         super(ToolbarZoomWidget, self).__init__(parent)
         self._show_label = True
+        self._last_scale_text = None
         layout = QHBoxLayout()
         self._scale_label = QLabel('Scale:')
         layout.addWidget(self._scale_label)
         btn_fit = QToolButton(central_widget)
-        btn_fit.setIcon(QIcon.fromTheme('zoom-fit-best'))
+        btn_fit.setIcon(_themeIcon('zoom-fit-best'))
         btn_fit.setIconSize(QSize(20, 20))
         btn_fit.setToolTip('Zoom to fit visible area (Ctrl+F)')
         btn_fit.clicked.connect(self.zoomBestFitRequest)
         layout.addWidget(btn_fit)
 
         btn_original = QToolButton(central_widget)
-        btn_original.setIcon(QIcon.fromTheme('zoom-original'))
+        btn_original.setIcon(_themeIcon('zoom-original'))
         btn_original.setIconSize(QSize(20, 20))
         btn_original.setToolTip('Zoom to original size (Ctrl+1)')
         btn_original.clicked.connect(self.zoomOriginalSizeRequest)
@@ -599,9 +758,13 @@ class ToolbarZoomWidget(QWidget):
         if not self._show_label:
             return
         if scale < 0.01:
-            self._scale_label.setText('Scale < 1 %')
+            txt = 'Scale < 1 %'
         else:
-            self._scale_label.setText('Scale {:d} %'.format(int(scale*100)))
+            txt = 'Scale {:d} %'.format(int(scale*100))
+        # Zooming emits many (sub-percent) scale changes, only relabel if needed
+        if txt != self._last_scale_text:
+            self._last_scale_text = txt
+            self._scale_label.setText(txt)
 
     def showScaleLabel(self, visible):
         self._show_label = visible
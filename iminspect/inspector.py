@@ -53,13 +53,15 @@ from typing import Tuple, Union
 #   Currently, I prefer not to deal with such unexpected user behavior, as
 #   this increases the code complexity unnecessarily.
 
+import functools
 import numpy as np
 import os
+from collections import OrderedDict
 from enum import Enum
 from qtpy.QtWidgets import QMainWindow, QApplication, QWidget, \
     QHBoxLayout, QVBoxLayout, QGridLayout, QLabel, QFrame, QToolTip, \
     QShortcut, QMessageBox, QScrollArea, QSizePolicy
-from qtpy.QtCore import Qt, QSize, QPoint, Signal, Slot
+from qtpy.QtCore import Qt, QSize, QPoint, QTimer, Signal, Slot
 from qtpy.QtGui import QCursor, QFont, QKeySequence, QResizeEvent, QIcon
 from PIL import UnidentifiedImageError
 
@@ -68,6 +70,12 @@ from vito import imutils, colormaps, imvis, flowutils
 from . import imgview, inputs, inspection_widgets, inspection_utils
 
 
+# Single-channel data types which are considered as monochrome/depth data by
+# default, see DataType.fromData()
+_MONOCHROME_DTYPES = frozenset([np.dtype('uint8'), np.dtype('float32'), np.dtype('float64')])
+_DEPTH_DTYPES = frozenset([np.dtype('uint16'), np.dtype('int32')])
+
+
 class DataType(Enum):
     # Standard 3- or 4-channel input
     COLOR = 0
@@ -88,22 +96,10 @@ class DataType(Enum):
     @staticmethod
     def toStr(dt):
         """Human-readable string representation of DataType enum."""
-        if dt == DataType.COLOR:
-            return 'color'
-        elif dt == DataType.MONOCHROME:
-            return 'monochrome'
-        elif dt == DataType.BOOL:
-            return 'mask'
-        elif dt == DataType.CATEGORICAL:
-            return 'labels'
-        elif dt == DataType.FLOW:
-            return 'flow'
-        elif dt == DataType.DEPTH:
-            return 'depth'
-        elif dt == DataType.MULTICHANNEL:
-            return 'multi-channel'
-        else:
-            raise NotImplementedError('DataType "%d" is not yet supported!' % dt)
+        try:
+            return _DATA_TYPE_NAMES[dt]
+        except KeyError:
+            raise NotImplementedError('DataType "%s" is not yet supported!' % dt) from None
 
     @staticmethod
     def fromData(npdata):
@@ -123,11 +119,11 @@ class DataType(Enum):
         if npdata is None:
             return DataType.COLOR
         if npdata.ndim < 3 or (npdata.ndim == 3 and npdata.shape[2] == 1):
-            if npdata.dtype is np.dtype('bool'):
+            if npdata.dtype.kind == 'b':
                 return DataType.BOOL
-            elif npdata.dtype in [np.dtype('uint8'), np.dtype('float32'), np.dtype('float64')]:
+            elif npdata.dtype in _MONOCHROME_DTYPES:
                 return DataType.MONOCHROME
-            elif npdata.dtype in [np.dtype('uint16'), np.dtype('int32')]:
+            elif npdata.dtype in _DEPTH_DTYPES:
                 return DataType.DEPTH
             else:
                 return DataType.CATEGORICAL
@@ -158,7 +154,7 @@ class DataType(Enum):
             return DataType.MULTICHANNEL
         else:
             try:
-                data = imutils.imread(filename)
+                data = _loadFile(filename, None)
                 if data.ndim < 3 or data.shape[2] == 1:
                     return DataType.MONOCHROME
                 return DataType.COLOR
@@ -178,25 +174,63 @@ class DataType(Enum):
         See also PIL modes:
         https://pillow.readthedocs.io/en/3.1.x/handbook/concepts.html#concept-modes
         """
-        if data_type == DataType.COLOR:
-            # Data may be single-channel, but the user requested us to treat
-            # it like a RGB image.
-            if data is None or len(data.shape) < 3 or data.shape[2] < 4:
-                return 'RGB'
-            else:
-                return 'RGBA'
-        elif data_type == DataType.MONOCHROME:
-            return 'L'
-        elif data_type == DataType.CATEGORICAL:
-            return 'I'
-        elif data_type == DataType.BOOL:
-            return '1'
-        elif data_type == DataType.DEPTH:
-            return 'I'
-        elif data_type in [DataType.FLOW, DataType.MULTICHANNEL]:
-            return None
-        else:
-            raise NotImplementedError('PIL mode for DataType "%s" is not yet configured' % DataType.toStr(data_type))
+        if data_type == DataType.COLOR and data is not None \
+                and len(data.shape) > 2 and data.shape[2] >= 4:
+            return 'RGBA'
+        # Otherwise, color data is treated like a RGB image (even if it is
+        # single-channel, because the user requested it)
+        try:
+            return _PIL_MODES[data_type]
+        except KeyError:
+            raise NotImplementedError('PIL mode for DataType "%s" is not yet configured' % DataType.toStr(data_type)) from None
+
+
+def _loadFile(filename, data_type):
+    """
+    Loads the file as the given DataType (or as image with PIL's default mode
+    if data_type is None).
+    """
+    if data_type == DataType.FLOW:
+        return flowutils.floread(filename)
+    if data_type == DataType.MULTICHANNEL:
+        return np.load(filename)
+    mode = None if data_type is None else DataType.pilModeFor(data_type, data=None)
+    data = imutils.imread(filename, mode=mode)
+    if data_type == DataType.BOOL:
+        data = data.astype(bool)
+    return data
+
+
+# Labels of the queried raw values (for data types other than 'Raw data'),
+# see InspectionWidget.getPixelValue()
+_QUERY_TYPE_LABELS = {
+    DataType.CATEGORICAL: 'Category',
+    DataType.FLOW: 'Flow'
+}
+
+
+# Human-readable names of the data types, see DataType.toStr()
+_DATA_TYPE_NAMES = {
+    DataType.COLOR: 'color',
+    DataType.MONOCHROME: 'monochrome',
+    DataType.BOOL: 'mask',
+    DataType.CATEGORICAL: 'labels',
+    DataType.FLOW: 'flow',
+    DataType.DEPTH: 'depth',
+    DataType.MULTICHANNEL: 'multi-channel'
+}
+
+
+# PIL's conversion modes of the data types, see DataType.pilModeFor()
+_PIL_MODES = {
+    DataType.COLOR: 'RGB',
+    DataType.MONOCHROME: 'L',
+    DataType.CATEGORICAL: 'I',
+    DataType.BOOL: '1',
+    DataType.DEPTH: 'I',
+    DataType.FLOW: None,
+    DataType.MULTICHANNEL: None
+}
 
 
 class InspectionWidget(QWidget):
@@ -206,6 +240,10 @@ class InspectionWidget(QWidget):
     VIS_RAW = -1
     # Ensure that grayscale is the second option
     VIS_COLORMAPS = ['Grayscale'] + [cmn for cmn in colormaps.colormap_names if cmn.lower() != 'grayscale']
+    # Colormap lookup tables, resolved once instead of upon each display update
+    _VIS_COLORMAP_TABLES = [colormaps.by_name(cmn) for cmn in VIS_COLORMAPS]
+    # Number of recent pseudocolorizations to keep (to quickly toggle visualizations)
+    PSEUDOCOLOR_CACHE_SIZE = 4
 
     # Emitted whenever the user changes the image scale (float).
     # The integer parameter will hold the "inspector_id" as set
@@ -241,10 +279,23 @@ class InspectionWidget(QWidget):
         self._visualized_data = None
         # Currently visualized pseudocolorized data
         self._visualized_pseudocolor = None
+        # Recently pseudocolorized data, see __cachedPseudocolor()
+        self._pseudocolor_cache = OrderedDict()
+        # Colors of the categories of label images, per colormap
+        self._category_palettes = dict()
+        # Color coded optical flow (computed upon first display)
+        self._flow_colorization = None
+        # Inputs of the currently displayed visualization, see __updateDisplay()
+        self._last_display_key = None
+        # Per-channel [min, max] of multi-channel data (computed along with the
+        # statistics, or lazily, see __visualizedDataLimits())
+        self._layer_limits = None
         # Whether the image viewer should be reset (adjust size and translation)
         self._reset_viewer = True
         # Function handle to format data values
         self.__fmt_fx = None
+        # Function handle to represent the raw data at a queried location
+        self.__query_raw_fx = None
         # Category labels to be displayed if data is CATEGORICAL
         self._categorical_labels = None
         # Handles to file I/O dialogs
@@ -275,8 +326,14 @@ class InspectionWidget(QWidget):
         if data is not None:
             self._data_type = DataType.fromData(data) if data_type is None else data_type
             self._is_single_channel = (data.ndim < 3) or (data.shape[2] == 1)
+            self.__query_raw_fx = self.__queryRawSingleChannel if self._is_single_channel \
+                else self.__queryRawMultiChannel
         self._visualized_data = None
         self._visualized_pseudocolor = None
+        self._pseudocolor_cache.clear()
+        self._category_palettes.clear()
+        self._flow_colorization = None
+        self._last_display_key = None
         self._categorical_labels = categorical_labels
         self._reset_viewer = True
         # Set up GUI
@@ -343,52 +400,58 @@ class InspectionWidget(QWidget):
 
     def getPixelValue(self, px_x, px_y):
         """Retrieves the image data at location (px_x, px_y)."""
-        if self._data is None:
+        data = self._data
+        if data is None:
             return None
         x = int(px_x)
         y = int(px_y)
-        width = self._data.shape[1] if self._data.ndim > 1 else 1
-        if x < 0 or x >= width or y < 0 or y >= self._data.shape[0]:
+        width = data.shape[1] if data.ndim > 1 else 1
+        if (x | y) < 0 or x >= width or y >= data.shape[0]:
             return None
         query = dict()
-        query['pos'] = '({:d}, {:d})'.format(x, y)
+        query['pos'] = f'({x:d}, {y:d})'
 
-        # Representation of raw data
+        # Representation of raw data (formatter is selected in inspectData)
         query['currlayer'] = None
-        if self._is_single_channel:
-            value = self._data[y] if self._data.ndim == 1 else self._data[y, x]
-            if self._data_type == DataType.CATEGORICAL \
-                    and self._categorical_labels is not None \
-                    and value in self._categorical_labels:
-                query['rawstr'] = self._categorical_labels[value] + ' (' + self.__fmt_fx(value) + ')'
-            else:
-                query['rawstr'] = self.__fmt_fx(value)
-        else:
-            query['rawstr'] = '[' + ', '.join([self.__fmt_fx(
-                self._data[y, x, c])
-                for c in range(self._data.shape[2])]) + ']'
-            # Representation of currently visualized data (if different from raw)
-            if self._layer_dropdown.get_input()[0] >= 0:
-                if len(self._visualized_data.shape) == 2:
-                    query['currlayer'] = self.__fmt_fx(self._visualized_data[y, x])
-                else:
-                    if self._visualized_data.shape[2] != 1:
-                        raise RuntimeError('Invalid number of channels')
-                    query['currlayer'] = self.__fmt_fx(self._visualized_data[y, x, 0])
-        query['dtypestr'] = 'Category' if self._data_type == DataType.CATEGORICAL \
-            else ('Flow' if self._data_type == DataType.FLOW else 'Raw data')
+        self.__query_raw_fx(query, x, y)
+        query['dtypestr'] = _QUERY_TYPE_LABELS.get(self._data_type, 'Raw data')
 
-        if self._visualized_pseudocolor is None:
+        pseudocolor = self._visualized_pseudocolor
+        if pseudocolor is None:
             query['pseudocol'] = None
         else:
-            query['pseudocol'] = '[' + ', '.join(
-                ['{:d}'.format(self._visualized_pseudocolor[y, x, c])
-                    for c in range(self._visualized_pseudocolor.shape[2])]) \
-                    + ']'
+            # Colors are uint8, so the Python ints can simply be converted via str()
+            query['pseudocol'] = '[' + ', '.join(map(str, pseudocolor[y, x].tolist())) + ']'
 
         query['scale'] = self.imageScale()
         return query
 
+    def __queryRawSingleChannel(self, query, x, y):
+        data = self._data
+        fmt = self.__fmt_fx
+        labels = self._categorical_labels
+        value = data[y] if data.ndim == 1 else data[y, x]
+        if self._data_type == DataType.CATEGORICAL \
+                and labels is not None and value in labels:
+            query['rawstr'] = labels[value] + ' (' + fmt(value) + ')'
+        else:
+            query['rawstr'] = fmt(value)
+
+    def __queryRawMultiChannel(self, query, x, y):
+        # Fetch all channels at once (as Python scalars) instead of
+        # indexing each channel separately
+        fmt = self.__fmt_fx
+        query['rawstr'] = '[' + ', '.join(map(fmt, self._data[y, x].tolist())) + ']'
+        # Representation of currently visualized data (if different from raw)
+        if self._layer_dropdown.get_input()[0] >= 0:
+            vis = self._visualized_data
+            if vis.ndim == 2:
+                query['currlayer'] = fmt(vis[y, x])
+            else:
+                if vis.shape[2] != 1:
+                    raise RuntimeError('Invalid number of channels')
+                query['currlayer'] = fmt(vis[y, x, 0])
+
     def linkAxes(self, other_inspection_widgets):
         self._img_viewer.linkViewers([oiw._img_viewer for oiw in other_inspection_widgets])
 
@@ -507,14 +570,7 @@ class InspectionWidget(QWidget):
             return
         try:
             filename, data_type = res
-            if data_type == DataType.FLOW:
-                data = flowutils.floread(filename)
-            elif data_type == DataType.MULTICHANNEL:
-                data = np.load(filename)
-            else:
-                data = imutils.imread(filename, mode=DataType.pilModeFor(data_type, data=None))
-                if data_type == DataType.BOOL:
-                    data = data.astype(np.bool)
+            data = _loadFile(filename, data_type)
             current_display = self.currentDisplaySettings()
             self.inspectData(data, data_type, display_settings=current_display)
             # Notify observers of loaded data
@@ -573,8 +629,16 @@ class InspectionWidget(QWidget):
         Additionally, information will be printed to stdout and shown on
         the GUI.
         """
-        contains_nan = np.any(np.isnan(self._data))
-        contains_inf = np.any(np.isinf(self._data))
+        # Only floating point data can contain non-finite values. A single
+        # isfinite pass suffices, NaN vs Inf only needs to be distinguished
+        # for the (usually few) non-finite values.
+        if np.issubdtype(self._data.dtype, np.inexact):
+            is_finite = np.isfinite(self._data)
+            nonfinite_data = None if np.all(is_finite) else self._data[~is_finite]
+        else:
+            nonfinite_data = None
+        contains_nan = nonfinite_data is not None and np.any(np.isnan(nonfinite_data))
+        contains_inf = nonfinite_data is not None and np.any(np.isinf(nonfinite_data))
         if contains_nan or contains_inf:
             # Prepare output string
             nonfin_str = ''
@@ -585,11 +649,30 @@ class InspectionWidget(QWidget):
                     nonfin_str += ', '
                 nonfin_str += 'NaN'
             # Compute limits on finite data only
-            finite_data = self._data[np.isfinite(self._data)]
+            finite_data = self._data[is_finite]
         else:
             finite_data = self._data
-        self._data_limits = [np.min(finite_data[:]), np.max(finite_data[:])]
-        # self._data_limits = [np.min(self._data[:]), np.max(self._data[:])]
+        # Per-layer limits are filled below or (for masks) upon first display
+        self._layer_limits = None if self._is_single_channel else [None] * self._data.shape[2]
+        channel_stats = None
+        if not self._is_single_channel and finite_data is self._data \
+                and self._data_type not in [DataType.BOOL, DataType.CATEGORICAL]:
+            # Multi-channel data without non-finite values: the global statistics
+            # can be derived from the per-channel reductions, so we scan only once.
+            # (num_pixels x channels), this is a view for C-contiguous data
+            pixels = self._data.reshape(-1, self._data.shape[2])
+            channel_stats = (pixels.min(axis=0), pixels.max(axis=0),
+                             pixels.mean(axis=0, dtype=np.float64),
+                             pixels.std(axis=0, dtype=np.float64))
+            if self._data.dtype.kind == 'b':
+                self._data_limits = [0.0, 1.0]
+            else:
+                self._data_limits = [np.min(channel_stats[0]), np.max(channel_stats[1])]
+        elif self._data.dtype.kind == 'b':
+            # No need to scan the data, the range of a boolean mask is known
+            self._data_limits = [0.0, 1.0]
+        else:
+            self._data_limits = [finite_data.min(), finite_data.max()]
 
         # Prepare 'header' for stdout summary
         stdout_str = list()
@@ -619,10 +702,10 @@ class InspectionWidget(QWidget):
             self._visualization_range_slider.setEnabled(False)
         elif self._data_type == DataType.CATEGORICAL:
             self.__fmt_fx = inspection_utils.fmti
-            data_cats, inv_cats = np.unique(self._data, return_inverse=True)
+            data_cats, inv_cats = inspection_utils.uniqueWithInverse(self._data)
             if self._categorical_labels is None:
                 self._data_categories = data_cats
-                self._data_inverse_categories = inv_cats.reshape(self._data.shape)
+                self._data_inverse_categories = inv_cats
                 num_present_categories = -1
             else:
                 # Gather all categories provided by the user
@@ -638,8 +721,15 @@ class InspectionWidget(QWidget):
                     print('    Missing categories: ', missing_cats, '\n')
                     self._data_categories.extend(missing_cats)
                 lookup = {k: self._data_categories.index(k) for k in self._data_categories}
-                ic = np.array([lookup[dctype(val)] for val in np.nditer(self._data)])
-                self._data_inverse_categories = ic.reshape(self._data.shape)
+                # np.unique already mapped each element to its present category, so
+                # we only need to look up the (few) present categories instead of
+                # every single element.
+                present_lookup = np.array([lookup[dctype(k)] for k in data_cats])
+                self._data_inverse_categories = present_lookup[inv_cats]
+            # Store the category indices with the smallest sufficient type (usually
+            # uint8), as this map is passed through the pseudocoloring.
+            self._data_inverse_categories = self._data_inverse_categories.astype(
+                np.min_scalar_type(len(self._data_categories) - 1), copy=False)
 
             self._colorbar.setCategories(self._data_categories)
             self._colorbar.setCategoricalLabels(self._categorical_labels)
@@ -662,15 +752,23 @@ class InspectionWidget(QWidget):
                 lbl_txt += '<tr><td colspan="2"><b>Label image, {:d}/{:d} classes.</b></td></tr>'.format(
                     num_present_categories, len(self._data_categories))
         else:
-            # global_mean = np.mean(self._data[:])
-            # global_std = np.std(self._data[:])
-            global_mean = np.mean(finite_data[:])
-            global_std = np.std(finite_data[:])
+            if channel_stats is None:
+                global_mean = finite_data.mean()
+                # Same two-pass computation as np.std(), but reusing the mean
+                # (i.e. one pass less over the data)
+                sq_dev = finite_data - global_mean
+                np.multiply(sq_dev, sq_dev, out=sq_dev)
+                global_std = np.sqrt(np.mean(sq_dev))
+            else:
+                # All channels have the same size, so the total variance is the mean
+                # of the channel variances plus the variance of the channel means.
+                global_mean = np.mean(channel_stats[2])
+                global_std = np.sqrt(np.mean(np.square(channel_stats[3])) + np.var(channel_stats[2]))
             self._visualization_range_slider.set_range(0, 255)
 
             stdout_str.append('Minimum: {}'.format(self._data_limits[0]))
             stdout_str.append('Maximum: {}'.format(self._data_limits[1]))
-            stdout_str.append('Mean:    {} +/- {}\n'.format(global_mean, global_std))
+            stdout_str.append('Mean:    {} +/- {}\n'.format(self.__fmt_fx(global_mean), self.__fmt_fx(global_std)))
 
             lbl_txt += '<tr><td><b>Range:</b> [{}, {}]</td><td><b>Mean:</b> {} &#177; {}</td></tr>'.format(
                 self.__fmt_fx(self._data_limits[0]),
@@ -679,20 +777,27 @@ class InspectionWidget(QWidget):
                 self.__fmt_fx(global_std))
 
             if not self._is_single_channel:
+                # Reduce all channels at once instead of slicing each layer
+                if contains_nan or contains_inf:
+                    num_channels = self._data.shape[2]
+                    channels_finite = np.all(is_finite.reshape(-1, num_channels), axis=0)
+                    # Non-finite values will be ignored by the nan-aware reductions
+                    pixels = np.where(is_finite, self._data, np.nan).reshape(-1, num_channels)
+                    cmins = np.nanmin(pixels, axis=0)
+                    cmaxs = np.nanmax(pixels, axis=0)
+                    cmeans = np.nanmean(pixels, axis=0, dtype=np.float64)
+                    cstds = np.nanstd(pixels, axis=0, dtype=np.float64)
+                else:
+                    channels_finite = np.ones(self._data.shape[2], dtype=bool)
+                    # Computed along with the global limits (accumulated in float64,
+                    # as the strided per-channel sums lose precision quickly for
+                    # float32 and small int data)
+                    cmins, cmaxs, cmeans, cstds = channel_stats
+                # Keep the layer limits, so changing the displayed layer doesn't need to rescan it
+                self._layer_limits = [[cmins[c], cmaxs[c]] for c in range(self._data.shape[2])]
                 for c in range(self._data.shape[2]):
-                    layer_data = self._data[:, :, c]
-                    is_finite = np.isfinite(layer_data)
-                    finite_layer_data = layer_data[is_finite]
-                    # cmin = np.min(self._data[:, :, c])
-                    # cmax = np.max(self._data[:, :, c])
-                    # cmean = np.mean(self._data[:, :, c])
-                    # cstd = np.std(self._data[:, :, c])
-                    cmin = np.min(finite_layer_data)
-                    cmax = np.max(finite_layer_data)
-                    cmean = np.mean(finite_layer_data)
-                    cstd = np.std(finite_layer_data)
-
-                    if not np.all(is_finite):
+                    cmin, cmax, cmean, cstd = cmins[c], cmaxs[c], cmeans[c], cstds[c]
+                    if not channels_finite[c]:
                         stdout_str.append('!! Channel {} contains non-finite values !!'.format(c))
                     stdout_str.append('Minimum on channel {}: {}'.format(c, cmin))
                     stdout_str.append('Maximum on channel {}: {}'.format(c, cmax))
@@ -835,6 +940,7 @@ class InspectionWidget(QWidget):
         if self._is_single_channel:
             self._visualized_data = self._data
             is_single_channel = True
+            layer_selection = -1
         else:
             layer_selection = self._layer_dropdown.get_input()[0]
             if layer_selection < 0:
@@ -855,49 +961,116 @@ class InspectionWidget(QWidget):
             self._visualization_dropdown.setEnabled(False)
             self._visualization_range_slider.setEnabled(False)
 
-        # Select visualization mode
+        # Skip the (re-)visualization if the displayed inputs did not change,
+        # e.g. upon restoring unchanged display settings
         vis_selection = self._visualization_dropdown.get_input()[0]
+        display_key = (layer_selection, vis_selection,
+                       self._visualization_range_slider.get_input()
+                       if self._visualization_range_slider.isEnabled() else None,
+                       self._checkbox_global_limits is not None and self._checkbox_global_limits.get_input())
+        if display_key == self._last_display_key and not self._reset_viewer:
+            return
+        self._last_display_key = display_key
+
+        # Select visualization mode
         if vis_selection == InspectionWidget.VIS_RAW or not is_single_channel:
             if not is_single_channel and self._data_type == DataType.FLOW:
-                self._visualized_pseudocolor = flowutils.colorize_flow(self._visualized_data)
+                # The color coding only depends on the data, so compute it only once
+                if self._flow_colorization is None:
+                    self._flow_colorization = flowutils.colorize_flow(self._visualized_data)
+                self._visualized_pseudocolor = self._flow_colorization
                 self._img_viewer.showImage(self._visualized_pseudocolor, reset_scale=self._reset_viewer)
                 self._colorbar.setFlowWheel(True)
                 self._colorbar.setVisible(True)
-                self._colorbar.update()
             else:
                 self._img_viewer.showImage(self._visualized_data, reset_scale=self._reset_viewer)
                 self._colorbar.setVisible(False)
                 self._visualized_pseudocolor = None
+                if is_single_channel:
+                    # Raw view has been selected explicitly, so don't keep the
+                    # (image-sized) pseudocolorizations around
+                    self._pseudocolor_cache.clear()
         else:
-            cm = colormaps.by_name(InspectionWidget.VIS_COLORMAPS[vis_selection])
+            cm = InspectionWidget._VIS_COLORMAP_TABLES[vis_selection]
             if self._visualization_range_slider.isEnabled():
                 # Query range slider for the visualization limits
                 limits = self.__getRangeSliderValues()
                 self._colorbar.setLimits(limits)
-                pc = imvis.pseudocolor(self._visualized_data, color_map=cm, limits=limits)
+                pc = self.__cachedPseudocolor(self._visualized_data, layer_selection,
+                                              vis_selection, cm, limits)
             else:
                 # Categorical and boolean data requires special treatment:
                 if self._data_type == DataType.CATEGORICAL:
-                    pc = imvis.pseudocolor(self._data_inverse_categories,
-                        color_map=cm, limits=[0, len(self._data_categories)-1])
+                    pc = self.__cachedPseudocolor(self._data_inverse_categories, layer_selection,
+                                                  vis_selection, cm, [0, len(self._data_categories)-1])
                 else:
-                    limits = [np.min(self._visualized_data[:]), np.max(self._visualized_data[:])]
-                    if self._data.dtype is np.dtype('bool'):
-                        limits = [float(v) for v in limits]
+                    if self._data.dtype.kind == 'b':
+                        limits = [0.0, 1.0]
+                    else:
+                        limits = self.__visualizedDataLimits(layer_selection)
                     self._colorbar.setLimits(limits)
-                    pc = imvis.pseudocolor(self._visualized_data, color_map=cm, limits=limits)
+                    pc = self.__cachedPseudocolor(self._visualized_data, layer_selection,
+                                                  vis_selection, cm, limits)
             self._visualized_pseudocolor = pc
             self._img_viewer.showImage(pc, reset_scale=self._reset_viewer)
             self._colorbar.setColormap(cm)
             self._colorbar.setFlowWheel(False)
             self._colorbar.setVisible(True)
-            self._colorbar.update()
             # We need to update the range slider's label text whenever there's a layer change
             # or the "global limits" checkbox is toggled. However, these already cause a
             # __updateDisplay() call. Thus, we just need to reset the label formatting function:
             self._visualization_range_slider.set_value_format_fx(self.__formatRangeSliderValue)
         self._reset_viewer = False
 
+    def __cachedPseudocolor(self, data, layer_selection, vis_selection, color_map, limits):
+        """
+        Returns the pseudocolorized data, reusing the result if the same layer,
+        colormap and limits have recently been visualized.
+        """
+        key = (layer_selection, vis_selection, tuple(float(v) for v in limits))
+        pc = self._pseudocolor_cache.get(key)
+        if pc is None:
+            if self._data_type == DataType.CATEGORICAL:
+                # The category colors only depend on the colormap
+                palette = self._category_palettes.get(vis_selection)
+                if palette is None:
+                    palette = imvis.pseudocolor(np.arange(len(self._data_categories)).reshape(1, -1),
+                                                color_map=color_map, limits=limits)[0]
+                    self._category_palettes[vis_selection] = palette
+            elif data.dtype.kind == 'u' and data.dtype.itemsize <= 2 \
+                    and data.size > np.iinfo(data.dtype).max + 1:
+                # 8/16 bit images (e.g. depth) have at most 65536 distinct values,
+                # so colorizing each possible value once pays off for larger images
+                palette_values = np.arange(np.iinfo(data.dtype).max + 1, dtype=data.dtype)
+                palette = imvis.pseudocolor(palette_values.reshape(1, -1),
+                                            color_map=color_map, limits=limits)[0]
+            else:
+                palette = None
+            if palette is not None:
+                # Each possible value (or category index) has been colorized
+                # once, so we simply look up each pixel's color
+                pc = np.take(palette, data.reshape(data.shape[0], -1), axis=0)
+            else:
+                pc = imvis.pseudocolor(data, color_map=color_map, limits=limits)
+            self._pseudocolor_cache[key] = pc
+            if len(self._pseudocolor_cache) > InspectionWidget.PSEUDOCOLOR_CACHE_SIZE:
+                self._pseudocolor_cache.popitem(last=False)
+        else:
+            self._pseudocolor_cache.move_to_end(key)
+        return pc
+
+    def __visualizedDataLimits(self, layer_selection):
+        """
+        Returns [min, max] of the visualized data, i.e. the given layer or all
+        data (if layer_selection < 0).
+        """
+        # Usually, these have already been computed along with the statistics
+        if layer_selection < 0:
+            return self._data_limits
+        if self._layer_limits[layer_selection] is None:
+            self._layer_limits[layer_selection] = [self._visualized_data.min(), self._visualized_data.max()]
+        return self._layer_limits[layer_selection]
+
     def __getRangeSliderValues(self):
         lower, upper = self._visualization_range_slider.get_input()
         lower = self.__rangeSliderValueToDataRange(lower)
@@ -911,12 +1084,13 @@ class InspectionWidget(QWidget):
         else:
             # Otherwise, the range slider has been set to [0, 255] or [0, 1]
             slider_interval = 1 if self._data_type == DataType.BOOL else 255
-            if self._visualized_data is None or (self._checkbox_global_limits is not None
+            layer_selection = -1 if self._is_single_channel else self._layer_dropdown.get_input()[0]
+            if self._visualized_data is None or layer_selection < 0 or (self._checkbox_global_limits is not None
                     and self._checkbox_global_limits.get_input()):
                 limits = self._data_limits
             else:
-                limits = [np.min(self._visualized_data[:]), np.max(self._visualized_data[:])]
-                if self._data.dtype is np.dtype('bool'):
+                limits = self.__visualizedDataLimits(layer_selection)
+                if self._data.dtype.kind == 'b':
                     limits = [float(v) for v in limits]
             data_interval = limits[1] - limits[0]
             return value / slider_interval * data_interval + limits[0]
@@ -957,6 +1131,15 @@ class Inspector(QMainWindow):
         self._display_tooltip = True
         self._open_file_dialog = None
         self._save_file_dialog = None
+        # Mouse moves are reported much more often than the status bar/tooltip
+        # can be perceived to change. Thus, we coalesce pixel queries (~60 Hz).
+        self._pending_pixel_query = None
+        # (inspector_id, x, y, scale) of the previous query, to skip sub-pixel moves
+        self._last_pixel_query = None
+        self._pixel_query_timer = QTimer(self)
+        self._pixel_query_timer.setSingleShot(True)
+        self._pixel_query_timer.setInterval(16)
+        self._pixel_query_timer.timeout.connect(self.__flushPixelValueQuery)
         # Create the central widget (layout will be adjusted within
         # inspectData()
         self._main_widget = QWidget()
@@ -1100,55 +1283,31 @@ class Inspector(QMainWindow):
                 insp.linkAxes(self._inspectors)
 
     def __addShortcuts(self):
-        # Open file
-        shortcut_open = QShortcut(QKeySequence('Ctrl+O'), self)
-        shortcut_open.activated.connect(self.__onOpenShortcut)
-        # Save file
-        shortcut_save = QShortcut(QKeySequence('Ctrl+S'), self)
-        shortcut_save.activated.connect(self.__onSaveShortcut)
-        # Reload/change visualization
-        shortcut_reload = QShortcut(QKeySequence('Ctrl+R'), self)
-        shortcut_reload.activated.connect(self.__onReloadShortcut)
-        # Close window
-        shortcut_exit_q = QShortcut(QKeySequence('Ctrl+Q'), self)
-        shortcut_exit_q.activated.connect(QApplication.instance().quit)
-        shortcut_exit_w = QShortcut(QKeySequence('Ctrl+W'), self)
-        shortcut_exit_w.activated.connect(QApplication.instance().quit)
-        # Zooming
-        shortcut_zoom_in = QShortcut(QKeySequence('Ctrl++'), self)
-        shortcut_zoom_in.activated.connect(lambda: self.zoomImages(120))
-        shortcut_zoom_in_fast = QShortcut(QKeySequence('Ctrl+Shift++'), self)
-        shortcut_zoom_in_fast.activated.connect(lambda: self.zoomImages(1200))
-        shortcut_zoom_out = QShortcut(QKeySequence('Ctrl+-'), self)
-        shortcut_zoom_out.activated.connect(lambda: self.zoomImages(-120))
-        shortcut_zoom_out_fast = QShortcut(QKeySequence('Ctrl+Shift+-'), self)
-        shortcut_zoom_out_fast.activated.connect(lambda: self.zoomImages(-1200))
-        # Scrolling
-        shortcut_scroll_up = QShortcut(QKeySequence('Ctrl+Up'), self)
-        shortcut_scroll_up.activated.connect(lambda: self.scrollImages(120, Qt.Vertical))
-        shortcut_scroll_up_fast = QShortcut(QKeySequence('Ctrl+Shift+Up'), self)
-        shortcut_scroll_up_fast.activated.connect(lambda: self.scrollImages(1200, Qt.Vertical))
-        shortcut_scroll_down = QShortcut(QKeySequence('Ctrl+Down'), self)
-        shortcut_scroll_down.activated.connect(lambda: self.scrollImages(-120, Qt.Vertical))
-        shortcut_scroll_down_fast = QShortcut(QKeySequence('Ctrl+Shift+Down'), self)
-        shortcut_scroll_down_fast.activated.connect(lambda: self.scrollImages(-1200, Qt.Vertical))
-        shortcut_scroll_left = QShortcut(QKeySequence('Ctrl+Left'), self)
-        shortcut_scroll_left.activated.connect(lambda: self.scrollImages(120, Qt.Horizontal))
-        shortcut_scroll_left_fast = QShortcut(QKeySequence('Ctrl+Shift+Left'), self)
-        shortcut_scroll_left_fast.activated.connect(lambda: self.scrollImages(1200, Qt.Horizontal))
-        shortcut_scroll_right = QShortcut(QKeySequence('Ctrl+Right'), self)
-        shortcut_scroll_right.activated.connect(lambda: self.scrollImages(-120, Qt.Horizontal))
-        shortcut_scroll_right_fast = QShortcut(QKeySequence('Ctrl+Shift+Right'), self)
-        shortcut_scroll_right_fast.activated.connect(lambda: self.scrollImages(-1200, Qt.Horizontal))
-        # Scale to fit window
-        shortcut_scale_fit = QShortcut(QKeySequence('Ctrl+F'), self)
-        shortcut_scale_fit.activated.connect(self.scaleImagesFit)
-        # Scale to original size
-        shortcut_scale_original = QShortcut(QKeySequence('Ctrl+1'), self)
-        shortcut_scale_original.activated.connect(self.scaleImagesOriginal)
-        # Toggle tool tip display
-        shortcut_toggle_tooltip = QShortcut(QKeySequence('Ctrl+T'), self)
-        shortcut_toggle_tooltip.activated.connect(self.toggleTooltipDisplay)
+        quit_app = QApplication.instance().quit
+        shortcuts = [
+            # Open/save file, reload/change visualization
+            ('Ctrl+O', self.__onOpenShortcut),
+            ('Ctrl+S', self.__onSaveShortcut),
+            ('Ctrl+R', self.__onReloadShortcut),
+            # Close window
+            ('Ctrl+Q', quit_app),
+            ('Ctrl+W', quit_app),
+            # Scale to fit window/to original size
+            ('Ctrl+F', self.scaleImagesFit),
+            ('Ctrl+1', self.scaleImagesOriginal),
+            # Toggle tool tip display
+            ('Ctrl+T', self.toggleTooltipDisplay)]
+        # Zooming and scrolling, the 'Shift' modifier speeds it up
+        for modifier, delta in [('Ctrl+', 120), ('Ctrl+Shift+', 1200)]:
+            shortcuts.extend([
+                (modifier + '+', functools.partial(self.zoomImages, delta)),
+                (modifier + '-', functools.partial(self.zoomImages, -delta)),
+                (modifier + 'Up', functools.partial(self.scrollImages, delta, Qt.Vertical)),
+                (modifier + 'Down', functools.partial(self.scrollImages, -delta, Qt.Vertical)),
+                (modifier + 'Left', functools.partial(self.scrollImages, delta, Qt.Horizontal)),
+                (modifier + 'Right', functools.partial(self.scrollImages, -delta, Qt.Horizontal))])
+        for key_sequence, slot in shortcuts:
+            QShortcut(QKeySequence(key_sequence), self).activated.connect(slot)
 
     @Slot(int)
     def scrollImages(self, delta, orientation):
@@ -1206,12 +1365,12 @@ class Inspector(QMainWindow):
         the data point at the cursor position. Requires result of _queryDataLocation
         as input.
         """
-        s = query['pos'] + ', ' + query['dtypestr'] + ': ' + query['rawstr']
+        parts = [query['pos'], ', ', query['dtypestr'], ': ', query['rawstr']]
         if query['currlayer'] is not None:
-            s += ', Current layer: ' + query['currlayer']
+            parts += [', Current layer: ', query['currlayer']]
         if query['pseudocol'] is not None:
-            s += ', Pseudocolor: ' + query['pseudocol']
-        return s
+            parts += [', Pseudocolor: ', query['pseudocol']]
+        return ''.join(parts)
 
     def __tooltipMessage(self, query):
         """
@@ -1219,24 +1378,48 @@ class Inspector(QMainWindow):
         data point at the cursor position. Requires result of _queryDataLocation
         as input.
         """
-        s = '<table><tr><td>Position:</td><td>' + query['pos'] + '</td></tr>'
-        s += '<tr><td>' + query['dtypestr'] + ':</td><td>' + query['rawstr'] + '</td></tr>'
+        parts = ['<table><tr><td>Position:</td><td>', query['pos'], '</td></tr><tr><td>',
+                 query['dtypestr'], ':</td><td>', query['rawstr'], '</td></tr>']
         if query['currlayer'] is not None:
-            s += '<tr><td>Layer:</td><td>' + query['currlayer'] + '</td></tr>'
+            parts += ['<tr><td>Layer:</td><td>', query['currlayer'], '</td></tr>']
         if query['pseudocol'] is not None:
-            s += '<tr><td>Colormap:</td><td> ' + query['pseudocol'] + '</td></tr>'
+            parts += ['<tr><td>Colormap:</td><td> ', query['pseudocol'], '</td></tr>']
         if query['scale'] is not None:
             if query['scale'] < 0.01:
                 sc = '< 1'
             else:
-                sc = '{:d}'.format(int(query['scale']*100))
-            s += '<tr><td>Scale:</td><td> ' + sc + '%</td></tr>'
-        s += '</table>'
-        return s
+                sc = f"{int(query['scale']*100):d}"
+            parts += ['<tr><td>Scale:</td><td> ', sc, '%</td></tr>']
+        parts.append('</table>')
+        return ''.join(parts)
 
     @Slot(int, object)
     def showPixelValue(self, inspector_id, image_pos):
         """Invoked whenever the mouse position changed."""
+        if image_pos is None:
+            # The visualization changed, so the same pixel needs to be queried again
+            self._last_pixel_query = None
+        else:
+            # Skip sub-pixel moves (unless the image has been zoomed, as the tool
+            # tip also shows the scale). Qt may have hidden the tool tip in the
+            # meantime (timeout or leave event), then it must be shown again.
+            query = (inspector_id, int(image_pos.x()), int(image_pos.y()),
+                     self._inspectors[inspector_id].imageScale())
+            if query == self._last_pixel_query \
+                    and (QToolTip.isVisible() or not self._display_tooltip):
+                return
+            self._last_pixel_query = query
+        # Only the most recent position will be queried once the timer fires
+        self._pending_pixel_query = (inspector_id, image_pos)
+        if not self._pixel_query_timer.isActive():
+            self._pixel_query_timer.start()
+
+    @Slot()
+    def __flushPixelValueQuery(self):
+        if self._pending_pixel_query is None:
+            return
+        inspector_id, image_pos = self._pending_pixel_query
+        self._pending_pixel_query = None
         if image_pos is None:
             # Position will be None if the user scrolls/zooms via keyboard
             # shortcuts. Thus, update info for positoin under cursor:
@@ -1342,7 +1525,11 @@ def inspect(
         settings.
     """
     if flip_channels:
-        data = imutils.flip_layers(data)
+        # flip_layers() returns a strided view for BGR data (BGRA needs a copy)
+        if inspection_utils.isArrayLike(data):
+            data = type(data)(imutils.flip_layers(d) for d in data)
+        else:
+            data = imutils.flip_layers(data)
     # If window title is not provided, make one (indicating the data type).
     app_label = Inspector.makeWindowTitle(label, data, data_type)
 
@@ -6,8 +6,11 @@ Very simple test suite (as most of the functionality is GUI-based and thus,
 rather complex to test).
 """
 
+import os
+import numpy as np
 import pytest
-from ..inspection_utils import fmti, fmtb, fmtf, fmt1f, fmt2f, fmt3f, fmt4f, FilenameUtils
+from ..inspection_utils import fmti, fmtb, fmtf, fmt1f, fmt2f, fmt3f, fmt4f, bestFormatFx, \
+    uniqueWithInverse, FilenameUtils
 
 
 def test_fmtb():
@@ -21,6 +24,9 @@ def test_fmti():
     assert fmti(3) == '3'
     assert fmti(-0) == '0'
     assert fmti(-42) == '-42'
+    assert fmti(float('nan')) == '?'
+    assert fmti(float('inf')) == '?'
+    assert fmti(float('-inf')) == '?'
 
 
 def test_fmtf():
@@ -52,6 +58,66 @@ def test_fmt4f():
     assert fmt4f(-12.08) == '-12.0800'
 
 
+def test_bestFormatFx():
+    assert bestFormatFx([0, 0.5]) is fmtf
+    assert bestFormatFx([-0.5, 0.5]) is fmt4f
+    assert bestFormatFx([1, 3]) is fmt3f
+    assert bestFormatFx([0, 9.99]) is fmt2f
+    assert bestFormatFx([0, 10]) is fmt1f
+    assert bestFormatFx([0, 100]) is fmti
+    assert bestFormatFx([0, float('inf')]) is fmti
+    assert bestFormatFx([0, float('nan')]) is fmti
+
+
+def test_uniqueWithInverse():
+    for dt in [np.uint8, np.uint16, np.int32, np.float32]:
+        data = np.array([[3, 1, 7], [7, 3, 3]], dtype=dt)
+        uniques, inverse = uniqueWithInverse(data)
+        assert uniques.dtype == data.dtype
+        assert np.array_equal(uniques, [1, 3, 7])
+        assert inverse.shape == data.shape
+        assert np.array_equal(uniques[inverse], data)
+    uniques, inverse = uniqueWithInverse(np.zeros((0, 3), dtype=np.uint8))
+    assert uniques.size == 0 and inverse.shape == (0, 3)
+
+
+@pytest.fixture(scope='module')
+def qapp():
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    QtWidgets = pytest.importorskip('qtpy.QtWidgets')
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def test_inspectBoolMultiChannel(qapp):
+    from ..inspector import InspectionWidget
+    data = np.zeros((4, 5, 3), dtype=bool)
+    data[1, 2, 0] = True
+    data[:, :, 2] = True
+    widget = InspectionWidget(0, data, None)
+    assert widget._data_limits == [0.0, 1.0]
+    assert [[bool(v) for v in lim] for lim in widget._layer_limits] == \
+        [[False, True], [False, False], [True, True]]
+    assert widget.getPixelValue(2, 1) is not None
+    widget.close()
+
+
+def test_categoricalImage():
+    # The color bar must show the same category colors as the pseudocolored
+    # label image (also if the colormap can't be split evenly)
+    from vito import colormaps, imvis
+    from ..inspection_widgets import _categoricalImage
+    cm = colormaps.by_name('viridis')
+    for num_categories in [2, 34]:
+        expected = imvis.pseudocolor(np.arange(num_categories).reshape(1, -1), color_map=cm,
+                                     limits=[0, num_categories - 1])[0]
+        img = _categoricalImage(np.asarray(cm, dtype=np.uint8), num_categories)
+        assert img.height() == num_categories
+        # The largest category is on top
+        for k in range(num_categories):
+            rgb = img.pixel(0, num_categories - 1 - k)
+            assert [(rgb >> 16) & 0xFF, (rgb >> 8) & 0xFF, rgb & 0xFF] == expected[k].tolist()
+
+
 def test_FilenameUtils():
     assert FilenameUtils.ensureImageExtension(None) is None
     with pytest.raises(ValueError):
@@ -77,3 +143,9 @@ def test_FilenameUtils():
     assert FilenameUtils.ensureFileExtension('foo.bar', ['bla', 'bar']) == 'foo.bar'
     assert FilenameUtils.ensureFileExtension('f00.BaR', ['bla', 'bar']) == 'f00.BaR'
     assert FilenameUtils.ensureFileExtension('foo.barz', ['bla', 'bar']) == 'foo.barz.bla'
+    assert FilenameUtils.ensureFileExtension('foo.barz', ('.BLA', 'bar')) == 'foo.barz.BLA'
+    assert FilenameUtils.ensureFileExtension('foo.bla', ('.BLA', 'bar')) == 'foo.bla'
+    # Only the last extension is compared, a bare extension is a file name
+    assert FilenameUtils.ensureFileExtension('.png', ['png']) == '.png.png'
+    assert FilenameUtils.ensureFileExtension('x.tar.gz', ['tar.gz']) == 'x.tar.gz.tar.gz'
+    assert FilenameUtils.ensureFileExtension('x.tar.gz', ['gz']) == 'x.tar.gz'